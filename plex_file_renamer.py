@@ -6,47 +6,284 @@ Plex File Renamer - Inspect video files, fetch metadata, and rename according to
 import os
 import re
 import sys
-import configparser
+import json
+import sqlite3
+import stat
+import io
+import contextlib
+import contextvars
+import collections
+import functools
+import subprocess
+import threading
+import time
+import types
+import zlib
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime
 from pathlib import Path
-from typing import Optional, Dict, Any, Tuple, List
-
-# Video inspection - using ffmpeg-python for better compatibility
-try:
-    import ffmpeg
-except ImportError:
-    print("Please install ffmpeg-python: pip install ffmpeg-python")
-    sys.exit(1)
+from typing import Optional, Dict, Any, Tuple, List, NamedTuple
 
 # HTTP requests for API calls
 try:
     import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
 except ImportError:
     print("Please install requests: pip install requests")
     sys.exit(1)
 
+# Optional faster JSON decoding for TMDb responses and ffprobe output
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+
+class _SQLiteStore:
+    """
+    Base for the on-disk caches: one sqlite file under ~/.cache/plex-renamer, opened once per run
+    The connection is shared by worker threads, so all access goes through self._lock
+    Subclasses set DEFAULT_PATH and SCHEMA, the statements that create their tables
+    """
+    
+    DEFAULT_PATH: Path
+    SCHEMA: Tuple[str, ...] = ()
+    
+    def __init__(self, db_path: Optional[Path] = None):
+        db_path = Path(db_path) if db_path else self.DEFAULT_PATH
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        
+        self.conn = sqlite3.connect(str(db_path), check_same_thread=False)
+        self._lock = threading.Lock()
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        for statement in self.SCHEMA:
+            self.conn.execute(statement)
+        self.conn.commit()
+
+
+class _SharedStore:
+    """
+    Lazily opened, process-wide instance of an _SQLiteStore subclass
+    If opening fails (e.g. read-only home directory) a warning is printed once and get() returns None from then on
+    """
+    
+    def __init__(self, store_class: type, description: str):
+        self._store_class = store_class
+        self._description = description
+        self._store: Optional[_SQLiteStore] = None
+        self._disabled = False
+        self._lock = threading.Lock()
+    
+    def get(self) -> Optional[_SQLiteStore]:
+        """The shared store, opening it on first use"""
+        with self._lock:
+            if self._store is None and not self._disabled:
+                try:
+                    self._store = self._store_class()
+                except (OSError, sqlite3.Error) as e:
+                    print(f"⚠️  Warning: Could not open {self._description}, continuing without it: {e}")
+                    self._disabled = True
+        
+        return self._store
+
+
+class ProbeCache(_SQLiteStore):
+    """
+    On-disk cache of ffprobe output so re-runs on the same library don't re-probe every file
+    Entries are keyed by (device, inode) rather than path, so they survive the renames this tool makes,
+    and are only reused while size and mtime still match. Stored zlib-compressed to keep the file small
+    """
+    
+    DEFAULT_PATH = Path.home() / '.cache' / 'plex-renamer' / 'probe.sqlite'
+    SCHEMA = (
+        "CREATE TABLE IF NOT EXISTS file_probes ("
+        "dev INTEGER, ino INTEGER, size INTEGER, mtime_ns INTEGER, json BLOB, PRIMARY KEY (dev, ino))",
+    )
+    
+    def __init__(self, db_path: Optional[Path] = None):
+        self._batch_depth = 0
+        super().__init__(db_path)
+    
+    def get(self, file_dev: int, file_ino: int, file_size: int, file_mtime_ns: int) -> Optional[Dict[str, Any]]:
+        """Return the cached probe for this file version, or None on a miss"""
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT json FROM file_probes WHERE dev = ? AND ino = ? AND size = ? AND mtime_ns = ?",
+                (file_dev, file_ino, file_size, file_mtime_ns)
+            ).fetchone()
+        return _json_loads(zlib.decompress(row[0])) if row else None
+    
+    def put(self, file_dev: int, file_ino: int, file_size: int, file_mtime_ns: int, probe: Dict[str, Any]) -> None:
+        """Store (or replace) the probe for this file"""
+        with self._lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO file_probes (dev, ino, size, mtime_ns, json) VALUES (?, ?, ?, ?, ?)",
+                (file_dev, file_ino, file_size, file_mtime_ns, zlib.compress(json.dumps(probe).encode()))
+            )
+            # Inside batch() the commit is deferred to the end of the batch
+            if not self._batch_depth:
+                self.conn.commit()
+    
+    @contextlib.contextmanager
+    def batch(self):
+        """Group writes made while scanning a directory into a single transaction"""
+        with self._lock:
+            self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            with self._lock:
+                self._batch_depth -= 1
+                if not self._batch_depth:
+                    self.conn.commit()
+
+
+_probe_cache = _SharedStore(ProbeCache, 'probe cache')
+
+# Upper bound on ffprobe subprocesses running at once, however many pools are probing
+MAX_PROBE_WORKERS = min(8, os.cpu_count() or 1)
+_probe_slots = threading.BoundedSemaphore(MAX_PROBE_WORKERS)
+
+
+def get_probe_cache() -> Optional[ProbeCache]:
+    """
+    Get the shared on-disk probe cache, opening it on first use
+    Returns None if the cache can't be opened (e.g. read-only home directory)
+    """
+    return _probe_cache.get()
+
+
+@functools.lru_cache(maxsize=1024)
+def _probe_cached(file_path: str, file_size: int, file_mtime_ns: int, file_dev: int, file_ino: int) -> Dict[str, Any]:
+    """
+    Run ffprobe once per file version, checking the on-disk cache first
+    The stat fields are only part of the cache key, so a changed file is re-probed
+    """
+    # Some filesystems (e.g. certain network shares) report no inode - don't trust the disk cache there
+    cache = get_probe_cache() if file_ino else None
+    
+    if cache:
+        try:
+            cached = cache.get(file_dev, file_ino, file_size, file_mtime_ns)
+            if cached is not None:
+                return cached
+        except (sqlite3.Error, zlib.error, ValueError) as e:
+            print(f"⚠️  Warning: Could not read probe cache: {e}")
+    
+    probe = VideoInspector._probe_minimal(file_path)
+    
+    if cache:
+        try:
+            cache.put(file_dev, file_ino, file_size, file_mtime_ns, probe)
+        except sqlite3.Error as e:
+            print(f"⚠️  Warning: Could not update probe cache: {e}")
+    
+    return probe
+
+
+# Map common codec names (as reported by ffprobe) to display format
+_VIDEO_CODEC_MAP = types.MappingProxyType({
+    'h264': 'H264',
+    'avc': 'H264',
+    'h265': 'H265',
+    'hevc': 'HEVC',
+    'mpeg4': 'MPEG4',
+    'vp9': 'VP9',
+    'vp8': 'VP8',
+    'av1': 'AV1'
+})
+
+_AUDIO_CODEC_MAP = types.MappingProxyType({
+    'aac': 'AAC',
+    'ac3': 'AC3',
+    'eac3': 'EAC3',
+    'dts': 'DTS',
+    'mp3': 'MP3',
+    'vorbis': 'OGG',
+    'opus': 'OPUS',
+    'flac': 'FLAC',
+    'truehd': 'TrueHD',
+    'dca': 'DTS'
+})
+
+# (min_height, min_width, label), checked top to bottom
+# Matches on height OR width to handle different aspect ratios -
+# many movies use cinematic aspect ratios (e.g., 1920x800)
+_RES_LADDER = (
+    (2160, 3840, '4K'),
+    (1440, 2560, '1440p'),
+    (1080, 1920, '1080p'),
+    (720, 1280, '720p'),
+    (480, 854, '480p'),
+)
+
+# Filename resolution claims -> the resolution label they correspond to (see check_resolution_mismatch)
+_CLAIMED_RESOLUTIONS = types.MappingProxyType({
+    '1080P': '1080p',
+    '720P': '720p',
+    '4K': '4K',
+    '2160P': '4K',
+    '480P': '480p',
+    '1440P': '1440p'
+})
+
+# Lowercased extensions of files get_video_files picks up
+_VIDEO_EXTENSIONS = frozenset({
+    '.mp4', '.mkv', '.avi', '.mov', '.wmv', '.flv', '.webm',
+    '.m4v', '.mpg', '.mpeg', '.3gp', '.3g2', '.ts', '.mts',
+    '.m2ts', '.vob', '.ogv', '.divx', '.xvid', '.rm', '.rmvb'
+})
+# Same extensions for str.endswith, which tests a whole tuple in one C call
+_VIDEO_EXTENSIONS_TUPLE = tuple(sorted(_VIDEO_EXTENSIONS))
+
+
+class ProbeError(Exception):
+    """ffprobe exited with an error - its output is kept on the exception for debugging"""
+    
+    def __init__(self, stdout: bytes, stderr: bytes):
+        super().__init__("ffprobe error (see stderr output for detail)")
+        self.stdout = stdout
+        self.stderr = stderr
+
 
 class VideoInspector:
     """Inspect video files to get metadata like duration"""
     
+    # Only the fields we actually read - keeps ffprobe output (and JSON parsing) small
+    PROBE_ENTRIES = 'format=duration:stream=codec_type,codec_name,width,height,duration'
+    
     @staticmethod
-    def get_video_duration(file_path: str) -> float:
-        """Get video duration in seconds using ffmpeg"""
+    def _probe_minimal(file_path: str) -> Dict[str, Any]:
+        """
+        Run ffprobe directly, asking only for the fields we use
+        Returns ffprobe's {'format': ..., 'streams': [...]} JSON
+        Raises ProbeError if ffprobe fails
+        """
+        args = ['ffprobe', '-v', 'error', '-show_entries', VideoInspector.PROBE_ENTRIES,
+                '-of', 'json', file_path]
+        with _probe_slots:
+            result = subprocess.run(args, capture_output=True)
+        if result.returncode != 0:
+            raise ProbeError(result.stdout, result.stderr)
+        return _json_loads(result.stdout)
+    
+    @staticmethod
+    def probe(file_path: str) -> Dict[str, Any]:
+        """Probe a video file, reusing the cached result if the file hasn't changed"""
         try:
-            probe = ffmpeg.probe(file_path)
-            # Try format duration first (most reliable)
-            if 'format' in probe and 'duration' in probe['format']:
-                return float(probe['format']['duration'])
-            
-            # Fallback to stream duration
-            for stream in probe.get('streams', []):
-                if 'duration' in stream:
-                    return float(stream['duration'])
-            
-            print("No duration information found in video file")
-            return 0.0
-        except Exception as e:
-            print(f"Error getting video duration: {e}")
-            return 0.0
+            st = os.stat(file_path)
+        except OSError:
+            # Can't build a cache key - probe directly
+            return VideoInspector._probe_minimal(file_path)
+        return _probe_cached(file_path, st.st_size, st.st_mtime_ns, st.st_dev, st.st_ino)
+    
+    @staticmethod
+    def get_video_duration(file_path: str) -> float:
+        """Get video duration in seconds - the duration field of get_media_info, from the same probe"""
+        return VideoInspector.get_media_info(file_path)['duration']
     
     @staticmethod
     def get_media_info(file_path: str) -> Dict[str, Any]:
@@ -54,85 +291,156 @@ class VideoInspector:
         Get detailed media information from video file using ffmpeg probe
         Returns dict with resolution, video codec, audio codec, etc.
         """
-        media_info = {
-            'resolution': None,
-            'video_codec': None,
-            'audio_codec': None,
-            'duration': 0.0
-        }
+        media_info = VideoInspector.empty_media_info()
         
         try:
-            probe = ffmpeg.probe(file_path)
+            probe = VideoInspector.probe(file_path)
             
-            # Get duration
+            # Get duration - format duration first (most reliable), falling back to stream duration
+            streams = probe.get('streams', [])
             if 'format' in probe and 'duration' in probe['format']:
                 media_info['duration'] = float(probe['format']['duration'])
+            else:
+                for stream in streams:
+                    if 'duration' in stream:
+                        media_info['duration'] = float(stream['duration'])
+                        break
             
-            # Parse streams for video and audio info
-            for stream in probe.get('streams', []):
-                if stream['codec_type'] == 'video' and not media_info['video_codec']:
-                    # Get video codec
-                    codec_name = stream.get('codec_name', '').lower()
-                    if codec_name:
-                        # Map common codec names to display format
-                        codec_map = {
-                            'h264': 'H264',
-                            'avc': 'H264',
-                            'h265': 'H265',
-                            'hevc': 'HEVC',
-                            'mpeg4': 'MPEG4',
-                            'vp9': 'VP9',
-                            'vp8': 'VP8',
-                            'av1': 'AV1'
-                        }
-                        media_info['video_codec'] = codec_map.get(codec_name, codec_name.upper())
-                    
-                    # Get resolution
-                    width = stream.get('width')
-                    height = stream.get('height')
-                    if width and height:
-                        # Store raw resolution for debugging
-                        media_info['raw_resolution'] = f"{width}x{height}"
-                        
-                        # Determine quality based on resolution
-                        # Use width OR height to handle different aspect ratios
-                        # Many movies use cinematic aspect ratios (e.g., 1920x800)
-                        if height >= 2160 or width >= 3840:
-                            media_info['resolution'] = '4K'
-                        elif height >= 1440 or width >= 2560:
-                            media_info['resolution'] = '1440p'
-                        elif height >= 1080 or width >= 1920:
-                            media_info['resolution'] = '1080p'
-                        elif height >= 720 or width >= 1280:
-                            media_info['resolution'] = '720p'
-                        elif height >= 480 or width >= 854:
-                            media_info['resolution'] = '480p'
-                        else:
-                            media_info['resolution'] = f'{height}p'
-                
-                elif stream['codec_type'] == 'audio' and not media_info['audio_codec']:
-                    # Get audio codec
-                    codec_name = stream.get('codec_name', '').lower()
-                    if codec_name:
-                        # Map common audio codec names
-                        audio_map = {
-                            'aac': 'AAC',
-                            'ac3': 'AC3',
-                            'eac3': 'EAC3',
-                            'dts': 'DTS',
-                            'mp3': 'MP3',
-                            'vorbis': 'OGG',
-                            'opus': 'OPUS',
-                            'flac': 'FLAC',
-                            'truehd': 'TrueHD',
-                            'dca': 'DTS'
-                        }
-                        media_info['audio_codec'] = audio_map.get(codec_name, codec_name.upper())
+            # Only the first usable video and audio stream matter - stop at each
+            video = VideoInspector._first_stream(streams, 'video')
+            if video:
+                VideoInspector._extract_video(video, media_info)
+            audio = VideoInspector._first_stream(streams, 'audio')
+            if audio:
+                VideoInspector._extract_audio(audio, media_info)
         
         except Exception as e:
             print(f"Note: Could not get detailed media info: {e}")
         
         return media_info
+    
+    @staticmethod
+    def empty_media_info() -> Dict[str, Any]:
+        """Media info with nothing known - what get_media_info starts from, and what --no-probe uses"""
+        return {
+            'resolution': None,
+            'video_codec': None,
+            'audio_codec': None,
+            'duration': 0.0
+        }
+    
+    @staticmethod
+    def _first_stream(streams: List[Dict[str, Any]], codec_type: str) -> Optional[Dict[str, Any]]:
+        """First stream of codec_type that names its codec, else the first of that type at all"""
+        return (next((s for s in streams if s.get('codec_type') == codec_type and s.get('codec_name')), None)
+                or next((s for s in streams if s.get('codec_type') == codec_type), None))
+    
+    @staticmethod
+    def _extract_video(stream: Dict[str, Any], media_info: Dict[str, Any]) -> None:
+        """Fill in video codec and resolution from a video stream"""
+        codec_name = stream.get('codec_name', '').lower()
+        if codec_name:
+            media_info['video_codec'] = _VIDEO_CODEC_MAP.get(codec_name, codec_name.upper())
+        
+        width = stream.get('width')
+        height = stream.get('height')
+        if width and height:
+            # Store raw resolution for debugging
+            media_info['raw_resolution'] = f"{width}x{height}"
+            
+            # Determine quality based on resolution (see _RES_LADDER)
+            for min_height, min_width, label in _RES_LADDER:
+                if height >= min_height or width >= min_width:
+                    media_info['resolution'] = label
+                    break
+            else:
+                media_info['resolution'] = f'{height}p'
+    
+    @staticmethod
+    def _extract_audio(stream: Dict[str, Any], media_info: Dict[str, Any]) -> None:
+        """Fill in audio codec from an audio stream"""
+        codec_name = stream.get('codec_name', '').lower()
+        if codec_name:
+            media_info['audio_codec'] = _AUDIO_CODEC_MAP.get(codec_name, codec_name.upper())
+
+
+class _RateLimiter:
+    """
+    Thread-safe token bucket: allows bursts of up to `capacity` calls, refilling at `rate` per second
+    Used to stay under TMDb's rate limit instead of tripping it and paying for a retry
+    """
+    
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self) -> None:
+        """Take one token, sleeping until one is available"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                
+                wait = (1 - self._tokens) / self.rate
+            
+            time.sleep(wait)
+
+
+class TMDbCache(_SQLiteStore):
+    """
+    On-disk cache of TMDb responses so re-runs (e.g. after adding a few files) are answered locally
+    Entries expire after MAX_AGE seconds, since titles and episode names do occasionally change
+    """
+    
+    DEFAULT_PATH = Path.home() / '.cache' / 'plex-renamer' / 'tmdb.sqlite'
+    MAX_AGE = 7 * 24 * 60 * 60
+    SCHEMA = (
+        "CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, fetched_at REAL, json BLOB)",
+    )
+    
+    def __init__(self, db_path: Optional[Path] = None):
+        super().__init__(db_path)
+        # Drop expired entries so the file doesn't grow forever
+        with self._lock:
+            self.conn.execute("DELETE FROM responses WHERE fetched_at < ?", (time.time() - self.MAX_AGE,))
+            self.conn.commit()
+    
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached response if it's younger than MAX_AGE, or None on a miss"""
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT json FROM responses WHERE key = ? AND fetched_at >= ?",
+                (key, time.time() - self.MAX_AGE)
+            ).fetchone()
+        return _json_loads(row[0]) if row else None
+    
+    def put(self, key: str, data: Any) -> None:
+        """Store (or replace) a response"""
+        with self._lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO responses (key, fetched_at, json) VALUES (?, ?, ?)",
+                (key, time.time(), json.dumps(data))
+            )
+            self.conn.commit()
+
+
+_tmdb_cache = _SharedStore(TMDbCache, 'TMDb cache')
+
+
+def get_tmdb_cache() -> Optional[TMDbCache]:
+    """
+    Get the shared on-disk TMDb response cache, opening it on first use
+    Returns None if the cache can't be opened (e.g. read-only home directory)
+    """
+    return _tmdb_cache.get()
 
 
 class TMDbAPI:
@@ -140,6 +448,10 @@ class TMDbAPI:
     
     BASE_URL = "https://api.themoviedb.org/3"
     
+    # Shared by every client - TMDb's limit (~40 requests / 10 seconds) applies per key, not per instance
+    # At most capacity + 10 * rate = 40 requests go out in any 10-second window
+    RATE_LIMITER = _RateLimiter(rate=3, capacity=10)
+    
     def __init__(self, api_key: Optional[str] = None):
         """Initialize with API key (get free key from themoviedb.org)"""
         # Priority: 1. Passed parameter, 2. Environment variable, 3. Config file
@@ -158,20 +470,102 @@ class TMDbAPI:
             print("3. Create ~/.plex-renamer.conf with api_key setting")
             print("\nGet a free API key at: https://www.themoviedb.org/settings/api")
             sys.exit(1)
+        
+        # One pooled keep-alive session for all calls, so only the first request pays for the TLS handshake
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=20,
+            # 429 responses are retried after the server's Retry-After delay
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504],
+                              respect_retry_after_header=True)
+        )
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.session.params = {'api_key': self.api_key}
+        
+        # Parsed responses keyed by (path, params) - see _get_json
+        self._cache: Dict[Tuple[str, Tuple], Any] = {}
+        # Requests in flight, so concurrent callers wait for one fetch instead of each making their own
+        self._pending: Dict[Tuple[str, Tuple], Future] = {}
+        self._cache_lock = threading.Lock()
+        # {(tv_id, season_number): {episode_number: episode}} - see _get_season_episodes
+        self._season_episodes: Dict[Tuple[int, int], Dict[int, Dict[str, Any]]] = {}
+    
+    def _get_json(self, path: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        """
+        GET a TMDb endpoint and return the parsed JSON, memoized for the life of this client
+        and on disk across runs (see TMDbCache)
+        Many files in a library share a show/movie, so the same lookups repeat a lot
+        Raises requests.exceptions.RequestException on failure (failures aren't cached)
+        Safe to call from several threads - a lookup already in flight is waited on, not repeated
+        """
+        params = params or {}
+        # Searches are case-insensitive on TMDb's side, so key them that way too
+        cache_key = (path, tuple(sorted(
+            (k, v.lower() if k == 'query' else v) for k, v in params.items()
+        )))
+        with self._cache_lock:
+            if cache_key in self._cache:
+                return self._cache[cache_key]
+            pending = self._pending.get(cache_key)
+            if pending is None:
+                future = self._pending[cache_key] = Future()
+        if pending is not None:
+            # Another thread is fetching this - share its result (or its exception)
+            return pending.result()
+        
+        disk_cache = get_tmdb_cache()
+        disk_key = json.dumps(cache_key)
+        try:
+            data = None
+            if disk_cache:
+                try:
+                    data = disk_cache.get(disk_key)
+                except (sqlite3.Error, ValueError) as e:
+                    print(f"⚠️  Warning: Could not read TMDb cache: {e}")
+            
+            if data is None:
+                self.RATE_LIMITER.acquire()
+                response = self.session.get(f"{self.BASE_URL}{path}", params=params)
+                response.raise_for_status()
+                try:
+                    data = _json_loads(response.content)
+                except ValueError as e:
+                    # Same error response.json() would raise, so callers' RequestException handling covers it
+                    # (e.g. an HTML page from a proxy or captive portal)
+                    raise requests.exceptions.JSONDecodeError(
+                        getattr(e, 'msg', str(e)), getattr(e, 'doc', ''), getattr(e, 'pos', 0),
+                        response=response
+                    ) from e
+                
+                # An empty search is kept for this run only - the title may just not be on TMDb yet,
+                # and caching the miss for MAX_AGE would keep reporting it as not found
+                if disk_cache and not (isinstance(data, dict) and data.get('results') == []):
+                    try:
+                        disk_cache.put(disk_key, data)
+                    except sqlite3.Error as e:
+                        print(f"⚠️  Warning: Could not update TMDb cache: {e}")
+        except Exception as e:
+            with self._cache_lock:
+                del self._pending[cache_key]
+            future.set_exception(e)
+            raise
+        
+        with self._cache_lock:
+            self._cache[cache_key] = data
+            del self._pending[cache_key]
+        future.set_result(data)
+        return data
     
     def search_movie(self, title: str, year: Optional[int] = None) -> Optional[Dict[str, Any]]:
         """Search for a movie by title and optional year"""
-        params = {
-            'api_key': self.api_key,
-            'query': title
-        }
+        params = {'query': title}
         if year:
             params['year'] = year
         
         try:
-            response = requests.get(f"{self.BASE_URL}/search/movie", params=params)
-            response.raise_for_status()
-            data = response.json()
+            data = self._get_json("/search/movie", params)
             
             if data['results']:
                 # Return the first (most relevant) result
@@ -183,17 +577,12 @@ class TMDbAPI:
     
     def search_tv(self, title: str, year: Optional[int] = None) -> Optional[Dict[str, Any]]:
         """Search for a TV show by title and optional year"""
-        params = {
-            'api_key': self.api_key,
-            'query': title
-        }
+        params = {'query': title}
         if year:
             params['first_air_date_year'] = year
         
         try:
-            response = requests.get(f"{self.BASE_URL}/search/tv", params=params)
-            response.raise_for_status()
-            data = response.json()
+            data = self._get_json("/search/tv", params)
             
             if data['results']:
                 return data['results'][0]
@@ -204,12 +593,8 @@ class TMDbAPI:
     
     def get_movie_details(self, movie_id: int) -> Optional[Dict[str, Any]]:
         """Get detailed movie information"""
-        params = {'api_key': self.api_key}
-        
         try:
-            response = requests.get(f"{self.BASE_URL}/movie/{movie_id}", params=params)
-            response.raise_for_status()
-            return response.json()
+            return self._get_json(f"/movie/{movie_id}")
         except requests.exceptions.RequestException as e:
             print(f"Error getting movie details: {e}")
         
@@ -217,53 +602,216 @@ class TMDbAPI:
     
     def get_tv_details(self, tv_id: int) -> Optional[Dict[str, Any]]:
         """Get detailed TV show information"""
-        params = {'api_key': self.api_key}
-        
         try:
-            response = requests.get(f"{self.BASE_URL}/tv/{tv_id}", params=params)
-            response.raise_for_status()
-            return response.json()
+            return self._get_json(f"/tv/{tv_id}")
         except requests.exceptions.RequestException as e:
             print(f"Error getting TV show details: {e}")
         
         return None
     
+    def _get_season_episodes(self, tv_id: int, season_number: int) -> Dict[int, Dict[str, Any]]:
+        """
+        Fetch a whole season once and index its episodes by episode number
+        Returns an empty dict if the season can't be fetched
+        """
+        key = (tv_id, season_number)
+        if key not in self._season_episodes:
+            try:
+                season = self._get_json(f"/tv/{tv_id}/season/{season_number}")
+                episodes = {ep['episode_number']: ep for ep in season.get('episodes', []) if 'episode_number' in ep}
+            except requests.exceptions.RequestException:
+                episodes = {}
+            self._season_episodes[key] = episodes
+        
+        return self._season_episodes[key]
+    
     def get_episode_details(self, tv_id: int, season_number: int, episode_number: int) -> Optional[Dict[str, Any]]:
-        """Get detailed episode information including title"""
-        params = {'api_key': self.api_key}
+        """
+        Get detailed episode information including title
+        Served from the cached season listing, so a season folder costs one request instead of one per episode
+        """
+        episode = self._get_season_episodes(tv_id, season_number).get(episode_number)
+        if episode:
+            return episode
         
+        # Not in the season listing - ask for the episode directly
         try:
-            response = requests.get(
-                f"{self.BASE_URL}/tv/{tv_id}/season/{season_number}/episode/{episode_number}", 
-                params=params
-            )
-            response.raise_for_status()
-            return response.json()
+            return self._get_json(f"/tv/{tv_id}/season/{season_number}/episode/{episode_number}")
         except requests.exceptions.RequestException as e:
             print(f"Error getting episode details: {e}")
         
         return None
+    
+    def get_tv_and_episode_details(self, tv_id: int, season_number: Optional[int] = None,
+                                   episode_number: Optional[int] = None) -> Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]]]:
+        """
+        Get show details and (if season and episode are given) episode details in parallel
+        The two lookups are independent, so this costs one round-trip instead of two
+        
+        Returns: (show_details, episode_details)
+        """
+        if season_number is None or episode_number is None:
+            return self.get_tv_details(tv_id), None
+        
+        # Worker threads share self.session, so they reuse its pooled connections
+        # Each runs in a copy of the caller's context so its prints follow the caller's (see _CapturedOutput)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            details_future = executor.submit(contextvars.copy_context().run,
+                                             self.get_tv_details, tv_id)
+            episode_future = executor.submit(contextvars.copy_context().run,
+                                             self.get_episode_details, tv_id, season_number, episode_number)
+            return details_future.result(), episode_future.result()
+
+
+class ParsedFilename(NamedTuple):
+    """Result of PlexFileNamer.parse_filename - season/episode are zero-padded strings"""
+    title: str
+    year: Optional[int]
+    season: Optional[str]
+    episode: Optional[str]
+
+
+class TvShowDebugInfo(NamedTuple):
+    """Intermediate values behind a TvShowInfo, reported by process_video_file"""
+    title_from_file: str
+    season_from_file: Optional[str]
+    season_from_folder: Optional[int]
+    show_name_from_path: Optional[str]
+    parent_folder: str
+    grandparent_folder: Optional[str]
+    has_season_folder: bool
+    in_movie_folder: bool
+    detected_episode: Optional[int]
+
+
+class TvShowInfo(NamedTuple):
+    """Result of PlexFileNamer.analyze_tv_show"""
+    show_name: str
+    season: Optional[int]
+    episode: Optional[int]
+    year: Optional[int]
+    is_tv_show: bool
+    missing_episode_warning: bool
+    debug_info: TvShowDebugInfo
 
 
 class PlexFileNamer:
     """Format filenames according to Plex naming conventions"""
     
+    # Common quality and source indicators as one word-bounded alternation (see extract_optional_info)
+    # Longer spellings come before their prefixes (web-dl/webdl/webrip before web) since the first
+    # alternative that fits wins. No IGNORECASE - the name is lowercased before matching
+    _OPTIONAL_INFO_RE = re.compile(r'\b(?:' + '|'.join((
+        r'1080p', r'720p', r'480p', r'4k', r'2160p',
+        r'bluray', r'blu-ray', r'brrip', r'bdrip',
+        r'web-dl', r'webdl', r'webrip', r'web',
+        r'hdtv', r'pdtv', r'sdtv',
+        r'x264', r'x265', r'h264', r'h265', r'hevc',
+        r'aac', r'ac3', r'dts', r'mp3',
+        r'proper', r'repack', r'extended', r'unrated',
+        r'director\'?s?\s?cut', r'theatrical'
+    )) + r')\b')
+    
+    # Season folder names: S1, S01, Season 1, Season01, or just a number
+    # Matched against the whole folder name with fullmatch(), so no ^...$ anchors
+    _SEASON_FOLDER_PATTERNS = (
+        re.compile(r'[Ss](\d+)', re.IGNORECASE),          # S1, S01, s1, s01
+        re.compile(r'[Ss]eason\s*(\d+)', re.IGNORECASE),  # Season 1, Season01, season 1
+        re.compile(r'(\d+)', re.IGNORECASE),              # Just a number (1, 01)
+    )
+    _SEASON_FOLDER_FIRST_CHARS = frozenset('Ss0123456789')
+    
+    # Parent/grandparent folder names that mark a movie rather than a TV show
+    _MOVIE_FOLDER_NAMES = frozenset({
+        'movies', 'movie', 'films', 'film', 'cinema', 'motion pictures',
+        'feature films', 'features', 'theatrical releases'
+    })
+    _MOVIE_FOLDER_SUBSTRINGS = ('movie', 'film')
+    
+    _SEPARATORS_RE = re.compile(r'[._-]+')
+    # Same characters one-for-one, for parse_filename which collapses the spaces afterwards anyway
+    _SEPARATORS_TABLE = str.maketrans('._-', '   ')
+    _BRACKETS_RE = re.compile(r'\s*\[.*?\]\s*')
+    _RELEASE_GROUP_RE = re.compile(r'-[A-Z][A-Z0-9]+$')
+    _WHITESPACE_RE = re.compile(r'\s+')
+    # Characters that aren't allowed in filenames, deleted via str.translate
+    _ILLEGAL_CHARS_TABLE = str.maketrans('', '', '<>:"/\\|?*')
+    
+    _DOT_YEAR_RE = re.compile(r'\.(\d{4})(?:\.|$)')  # .1999. or .1999 at end (dot-separated)
+    # No leading \s* on these - parse_filename strips the title anyway, and a
+    # leading \s* makes search() retry it from every whitespace position
+    _PAREN_YEAR_RE = re.compile(r'\((\d{4})\)\s*$')  # " (2004)" at end
+    # Trailing year patterns as (pattern, dot_separated) - see parse_filename
+    _PARENTHESES_YEAR_PATTERNS = (
+        (_PAREN_YEAR_RE, False),
+    )
+    _TRAILING_YEAR_PATTERNS = (
+        (_DOT_YEAR_RE, True),
+        (re.compile(r'-\s*(\d{4})\s*$'), False),     # " - 2004" at end
+        (re.compile(r'\s+(\d{4})\s*$'), False),       # " 2004" at end
+        (_PAREN_YEAR_RE, False),
+    )
+    
+    # TV show patterns - PRIORITY ORDER (most specific first)
+    _SEASON_EPISODE_PATTERNS = (
+        # Patterns with both season and episode (highest priority)
+        (re.compile(r'[Ss](\d+)[Ee](\d+)'), 'both'),                        # S01E01, S1E1
+        (re.compile(r'(\d+)[xX](\d+)'), 'both'),                            # 1x01, 01x01
+        (re.compile(r'[Ss]eason\s*(\d+)\s*[Ee]pisode\s*(\d+)'), 'both'),   # Season 1 Episode 1
+        (re.compile(r'(\d+)\.(\d+)'), 'both'),                              # 1.01, 01.01
+        
+        # Episode-only patterns (season from folder or default to 1)
+        (re.compile(r'[Ee](\d+)'), 'episode'),                              # E01, E1
+        (re.compile(r'[Ee]pisode\s*(\d+)'), 'episode'),                     # Episode 1, Episode 01
+        # Only match 3-digit episode codes that are NOT at the start of the title
+        # This prevents "12 Strong" from being detected as episode 12
+        (re.compile(r'(?<!^)(\d{3})(?!\d)'), 'episode'),                    # 101, 201 (3-digit episode codes, not at start)
+    )
+    
+    # Every year and season/episode pattern above needs a digit - names without one skip them all
+    _DIGIT_RE = re.compile(r'\d')
+    
+    # Quality/source/codec info that might still be in the title, as one alternation
+    # so the title is scanned once rather than once per group
+    _QUALITY_RE = re.compile(r'\b(?:' + '|'.join((
+        r'\d{3,4}p',  # 720p, 1080p, etc.
+        r'BluRay|BLURAY|BRRip|BDRip|WEB-DL|WEBRip|HDTV|DVDRip',
+        r'x264|x265|h264|h265|HEVC|XviD|DivX',
+        r'AAC|AC3|DTS|MP3|FLAC',
+        r'PROPER|REPACK|EXTENDED|UNRATED'
+    )) + r')\b', re.IGNORECASE)
+    
+    # Keywords combine_optional_info carries over from the filename, checked as substrings of the
+    # uppercased filename info. Tuples, not sets: the first source keyword found wins, and
+    # "DIRECTOR'S CUT" spans a space so it can't be matched as a single token
+    _SOURCE_KEYWORDS = ('BLURAY', 'WEB-DL', 'WEBDL', 'WEBRIP', 'HDTV', 'PDTV', 'SDTV', 'BRRIP', 'BDRIP', 'DVD', 'DVDRIP')
+    _SPECIAL_KEYWORDS = ('PROPER', 'REPACK', 'EXTENDED', 'UNRATED', 'DIRECTOR\'S CUT', 'THEATRICAL')
+    
+    @staticmethod
+    def _stem(filename: str) -> str:
+        """Path(filename).stem for a bare filename, without building a Path"""
+        head, dot, tail = filename.rpartition('.')
+        # Like Path, keep dotfiles (".mkv") and trailing dots ("name.") whole
+        return head if head and tail else filename
+    
     @staticmethod
     def detect_season_from_folder(file_path: Path) -> Optional[int]:
         """
         Detect season number from folder structure
         Looks for patterns like: S01, S1, Season 1, Season01, etc.
         """
-        parent_folder = file_path.parent.name
-        
-        season_patterns = [
-            r'^[Ss](\d+)$',                    # S1, S01, s1, s01
-            r'^[Ss]eason\s*(\d+)$',           # Season 1, Season01, season 1
-            r'^(\d+)$',                        # Just a number (1, 01)
-        ]
+        return PlexFileNamer._season_from_folder_name(file_path.parent.name)
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _season_from_folder_name(parent_folder: str) -> Optional[int]:
+        """Season number for a folder name, cached since every file in a season folder asks"""
+        # Every season pattern starts with S/s or a digit, which rules out most show names up front
+        if parent_folder[:1] not in PlexFileNamer._SEASON_FOLDER_FIRST_CHARS:
+            return None
         
-        for pattern in season_patterns:
-            match = re.match(pattern, parent_folder, re.IGNORECASE)
+        for pattern in PlexFileNamer._SEASON_FOLDER_PATTERNS:
+            match = pattern.fullmatch(parent_folder)
             if match:
                 return int(match.group(1))
         
@@ -275,30 +823,30 @@ class PlexFileNamer:
         Extract TV show name from folder structure
         If parent folder is season folder, use grandparent as show name
         """
-        parent_folder = file_path.parent.name
-        
+        return PlexFileNamer._show_name_from_folders(file_path.parent.name, file_path.parent.parent.name)
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _show_name_from_folders(parent_folder: str, grandparent_folder: str) -> Optional[str]:
+        """Show name for a parent/grandparent folder pair, cached like _season_from_folder_name"""
         # Check if parent folder is a season folder
-        season_patterns = [
-            r'^[Ss]\d+$',                     # S1, S01
-            r'^[Ss]eason\s*\d+$',            # Season 1, Season01
-            r'^\d+$',                         # Just a number
-        ]
+        is_season_folder = PlexFileNamer._season_from_folder_name(parent_folder) is not None
         
-        is_season_folder = any(re.match(pattern, parent_folder, re.IGNORECASE) for pattern in season_patterns)
-        
-        if is_season_folder and file_path.parent.parent.name:
+        if is_season_folder and grandparent_folder:
             # Use grandparent folder as show name
-            show_name = file_path.parent.parent.name
+            show_name = grandparent_folder
         else:
             # Use parent folder as show name
             show_name = parent_folder
         
         # Clean up the show name
-        show_name = re.sub(r'[._-]+', ' ', show_name).strip()
-        return show_name if show_name else None
+        show_name = PlexFileNamer._SEPARATORS_RE.sub(' ', show_name).strip()
+        # Interned, like parse_filename's titles - every file in the show shares one string
+        return sys.intern(show_name) if show_name else None
     
     @staticmethod
-    def parse_filename(filename: str, parentheses_only: bool = False, skip_episode_detection: bool = False) -> Tuple[str, Optional[int], Optional[str], Optional[str]]:
+    @functools.lru_cache(maxsize=4096)
+    def parse_filename(filename: str, parentheses_only: bool = False, skip_episode_detection: bool = False) -> ParsedFilename:
         """
         Parse filename to extract title, year, season, and episode
         
@@ -307,42 +855,43 @@ class PlexFileNamer:
             parentheses_only: If True, only look for years in parentheses (2004)
             skip_episode_detection: If True, skip episode/season detection (for movies)
         
-        Returns: (title, year, season, episode)
+        Returns: ParsedFilename(title, year, season, episode)
+        Results are cached - the returned tuple is shared, which is fine since it's immutable
         """
         # Remove file extension
-        name = Path(filename).stem
+        name = PlexFileNamer._stem(filename)
         
         # Pre-process: Remove bracketed optional info (quality, codecs, etc.)
         # This handles already-renamed files like "Movie (2019) [1080p H264].mp4"
-        name = re.sub(r'\s*\[.*?\]\s*', '', name)  # Remove [anything] brackets
+        # (substring checks first - most names have neither, and `in` is far cheaper than a regex)
+        if '[' in name:
+            name = PlexFileNamer._BRACKETS_RE.sub('', name)  # Remove [anything] brackets
         
         # Pre-process: Remove common release group tags and quality info at the end
         # This helps with files like "The.Matrix.1999.1080p.BluRay.x264-GROUP"
         # Only remove if it's clearly a release group (uppercase, common patterns)
-        name = re.sub(r'-[A-Z][A-Z0-9]+$', '', name)  # Remove -GROUP (uppercase release groups)
+        if '-' in name:
+            name = PlexFileNamer._RELEASE_GROUP_RE.sub('', name)  # Remove -GROUP (uppercase release groups)
         
         year = None
+        # One C-level scan instead of running every year and season/episode pattern on a name with no digits
+        has_digits = PlexFileNamer._DIGIT_RE.search(name) is not None
         
-        if parentheses_only:
+        if not has_digits:
+            trailing_year_patterns = ()
+        elif parentheses_only:
             # Only look for years in parentheses: " (2004)" at the end
-            trailing_year_patterns = [
-                r'\s*\((\d{4})\)\s*$',      # " (2004)" at end
-            ]
+            trailing_year_patterns = PlexFileNamer._PARENTHESES_YEAR_PATTERNS
         else:
             # Look for all year patterns including dot-separated
-            trailing_year_patterns = [
-                r'\.(\d{4})(?:\.|$)',       # .1999. or .1999 at end (dot-separated)
-                r'\s*-\s*(\d{4})\s*$',      # " - 2004" at end
-                r'\s+(\d{4})\s*$',          # " 2004" at end  
-                r'\s*\((\d{4})\)\s*$',      # " (2004)" at end
-            ]
-        
-        for pattern in trailing_year_patterns:
-            match = re.search(pattern, name)
+            trailing_year_patterns = PlexFileNamer._TRAILING_YEAR_PATTERNS
+        
+        for pattern, dot_separated in trailing_year_patterns:
+            match = pattern.search(name)
             if match:
                 year = int(match.group(1))
                 # Remove the year and everything after it for dot-separated files
-                if '.' in name and pattern == r'\.(\d{4})(?:\.|$)':
+                if '.' in name and dot_separated:
                     name = name[:match.start()]
                 else:
                     name = name[:match.start()].strip()
@@ -352,25 +901,10 @@ class PlexFileNamer:
         episode = None
         
         # Skip episode detection if we're processing a movie
-        if not skip_episode_detection:
-            # Check for TV show patterns - PRIORITY ORDER (most specific first)
-            season_episode_patterns = [
-                # Patterns with both season and episode (highest priority)
-                (r'[Ss](\d+)[Ee](\d+)', 'both'),                        # S01E01, S1E1
-                (r'(\d+)[xX](\d+)', 'both'),                            # 1x01, 01x01  
-                (r'[Ss]eason\s*(\d+)\s*[Ee]pisode\s*(\d+)', 'both'),   # Season 1 Episode 1
-                (r'(\d+)\.(\d+)', 'both'),                              # 1.01, 01.01
-                
-                # Episode-only patterns (season from folder or default to 1)
-                (r'[Ee](\d+)', 'episode'),                              # E01, E1
-                (r'[Ee]pisode\s*(\d+)', 'episode'),                     # Episode 1, Episode 01
-                # Only match 3-digit episode codes that are NOT at the start of the title
-                # This prevents "12 Strong" from being detected as episode 12
-                (r'(?<!^)(\d{3})(?!\d)', 'episode'),                    # 101, 201 (3-digit episode codes, not at start)
-            ]
-            
-            for pattern, pattern_type in season_episode_patterns:
-                match = re.search(pattern, name)
+        if not skip_episode_detection and has_digits:
+            # Check for TV show patterns - PRIORITY ORDER (see _SEASON_EPISODE_PATTERNS)
+            for pattern, pattern_type in PlexFileNamer._SEASON_EPISODE_PATTERNS:
+                match = pattern.search(name)
                 if match:
                     if pattern_type == 'both':
                         season = match.group(1).zfill(2) 
@@ -392,54 +926,50 @@ class PlexFileNamer:
         
         # Clean up the title
         # Replace dots, underscores, and dashes with spaces
-        title = re.sub(r'[._-]+', ' ', name).strip()
+        title = name.translate(PlexFileNamer._SEPARATORS_TABLE).strip()
         # Remove any quality/source/codec info that might still be in the title
-        quality_patterns = [
-            r'\b\d{3,4}p\b',  # 720p, 1080p, etc.
-            r'\b(?:BluRay|BLURAY|BRRip|BDRip|WEB-DL|WEBRip|HDTV|DVDRip)\b',
-            r'\b(?:x264|x265|h264|h265|HEVC|XviD|DivX)\b',
-            r'\b(?:AAC|AC3|DTS|MP3|FLAC)\b',
-            r'\b(?:PROPER|REPACK|EXTENDED|UNRATED)\b'
-        ]
-        for pattern in quality_patterns:
-            title = re.sub(pattern, '', title, flags=re.IGNORECASE)
+        title = PlexFileNamer._QUALITY_RE.sub('', title)
         # Clean up multiple spaces and trim
-        title = re.sub(r'\s+', ' ', title).strip()
+        title = PlexFileNamer._WHITESPACE_RE.sub(' ', title).strip()
+        # Interned so the many files of one show/movie share a single title string, whose hash
+        # is then computed once for all the lookups keyed on it
+        title = sys.intern(title)
         
-        return title, year, season, episode
+        return ParsedFilename(title, year, season, episode)
     
     @staticmethod
-    def analyze_tv_show(file_path: Path, parentheses_only: bool = False) -> Dict[str, Any]:
+    @functools.lru_cache(maxsize=4096)
+    def analyze_tv_show(file_path: Path, parentheses_only: bool = False) -> TvShowInfo:
         """
         Comprehensive TV show analysis combining folder structure and filename
         
         Returns:
-            Dict with: show_name, season, episode, year, is_tv_show
+            TvShowInfo with: show_name, season, episode, year, is_tv_show
+        Results are cached like parse_filename's - it only looks at the path, never the file
         """
         filename = file_path.name
+        # Each .parent builds a new Path, so look the folder names up once and reuse them below
+        parent = file_path.parent
+        parent_name = parent.name
+        grandparent_name = parent.parent.name
         
         # Check if file is in a movie folder first (before parsing)
-        movie_folder_names = {
-            'movies', 'movie', 'films', 'film', 'cinema', 'motion pictures',
-            'feature films', 'features', 'theatrical releases'
-        }
+        parent_lower = parent_name.lower()
+        grandparent_lower = grandparent_name.lower()
         
-        parent_lower = file_path.parent.name.lower()
-        grandparent_lower = file_path.parent.parent.name.lower() if file_path.parent.parent.name else ''
-        
-        in_movie_folder = (parent_lower in movie_folder_names or 
-                          grandparent_lower in movie_folder_names or
-                          'movie' in parent_lower or 
-                          'film' in parent_lower)
+        # 'movie'/'film' substrings already cover most of _MOVIE_FOLDER_NAMES, so test those first
+        in_movie_folder = (any(s in parent_lower for s in PlexFileNamer._MOVIE_FOLDER_SUBSTRINGS) or
+                          parent_lower in PlexFileNamer._MOVIE_FOLDER_NAMES or
+                          grandparent_lower in PlexFileNamer._MOVIE_FOLDER_NAMES)
         
         # Parse filename - skip episode detection if in movie folder
         title_from_file, year, season_from_file, episode_from_file = PlexFileNamer.parse_filename(filename, parentheses_only, skip_episode_detection=in_movie_folder)
         
-        # Detect season from folder structure
-        season_from_folder = PlexFileNamer.detect_season_from_folder(file_path)
+        # Detect season from folder structure (what detect_season_from_folder does, from the names above)
+        season_from_folder = PlexFileNamer._season_from_folder_name(parent_name)
         
-        # Extract show name from path
-        show_name_from_path = PlexFileNamer.extract_show_name_from_path(file_path)
+        # Extract show name from path (likewise extract_show_name_from_path)
+        show_name_from_path = PlexFileNamer._show_name_from_folders(parent_name, grandparent_name)
         
         # Episode detection (REQUIRED for TV shows)
         final_episode = int(episode_from_file) if episode_from_file else None
@@ -472,25 +1002,25 @@ class PlexFileNamer:
         else:
             final_show_name = title_from_file
         
-        return {
-            'show_name': final_show_name,
-            'season': final_season,
-            'episode': final_episode,
-            'year': year,
-            'is_tv_show': is_tv_show,
-            'missing_episode_warning': missing_episode_warning,
-            'debug_info': {
-                'title_from_file': title_from_file,
-                'season_from_file': season_from_file,
-                'season_from_folder': season_from_folder,
-                'show_name_from_path': show_name_from_path,
-                'parent_folder': file_path.parent.name,
-                'grandparent_folder': file_path.parent.parent.name if file_path.parent.parent.name else None,
-                'has_season_folder': has_season_folder,
-                'in_movie_folder': in_movie_folder,
-                'detected_episode': final_episode
-            }
-        }
+        return TvShowInfo(
+            show_name=final_show_name,
+            season=final_season,
+            episode=final_episode,
+            year=year,
+            is_tv_show=is_tv_show,
+            missing_episode_warning=missing_episode_warning,
+            debug_info=TvShowDebugInfo(
+                title_from_file=title_from_file,
+                season_from_file=season_from_file,
+                season_from_folder=season_from_folder,
+                show_name_from_path=show_name_from_path,
+                parent_folder=parent_name,
+                grandparent_folder=grandparent_name or None,
+                has_season_folder=has_season_folder,
+                in_movie_folder=in_movie_folder,
+                detected_episode=final_episode
+            )
+        )
     
     @staticmethod
     def format_movie_name(title: str, year: int, optional_info: Optional[str] = None) -> str:
@@ -498,11 +1028,11 @@ class PlexFileNamer:
         Format movie filename according to Plex convention
         Example: "Movie Title (2020) [1080p BluRay].mp4"
         """
-        safe_title = re.sub(r'[<>:"/\\|?*]', '', title)
-        filename = f"{safe_title} ({year})"
+        safe_title = title.translate(PlexFileNamer._ILLEGAL_CHARS_TABLE)
+        parts = [safe_title, f" ({year})"]
         if optional_info:
-            filename += f" [{optional_info}]"
-        return filename
+            parts.append(f" [{optional_info}]")
+        return "".join(parts)
     
     @staticmethod
     def format_tv_name(show_title: str, season: int, episode: int, 
@@ -513,23 +1043,23 @@ class PlexFileNamer:
         Example: "Show Name (2020) - s01e01 - Episode Title [1080p BluRay].mp4"
         Plex format: ShowName (Year) - sXXeYY - Episode Title [Optional_Info].ext
         """
-        safe_title = re.sub(r'[<>:"/\\|?*]', '', show_title)
+        safe_title = show_title.translate(PlexFileNamer._ILLEGAL_CHARS_TABLE)
         
-        filename = safe_title
+        parts = [safe_title]
         if year:
-            filename += f" ({year})"
+            parts.append(f" ({year})")
         # Use lowercase 's' and 'e' as per Plex specification
-        filename += f" - s{season:02d}e{episode:02d}"
+        parts.append(f" - s{season:02d}e{episode:02d}")
         
         if episode_title:
-            safe_episode_title = re.sub(r'[<>:"/\\|?*]', '', episode_title)
-            filename += f" - {safe_episode_title}"
+            safe_episode_title = episode_title.translate(PlexFileNamer._ILLEGAL_CHARS_TABLE)
+            parts.append(f" - {safe_episode_title}")
         
         # Add optional info in brackets (ignored by Plex for matching)
         if optional_info:
-            filename += f" [{optional_info}]"
+            parts.append(f" [{optional_info}]")
         
-        return filename
+        return "".join(parts)
     
     @staticmethod
     def combine_optional_info(filename_info: Optional[str], media_info: Dict[str, Any]) -> Optional[str]:
@@ -539,66 +1069,63 @@ class PlexFileNamer:
         Only uses filename for source info (BluRay, WEB-DL) that can't be detected from file
         """
         info_parts = []
+        seen = set()  # uppercased entries of info_parts
+        
+        def add(part: str) -> None:
+            if part.upper() not in seen:
+                seen.add(part.upper())
+                info_parts.append(part)
         
         # ALWAYS use resolution from ffmpeg probe (ignores filename claims like "1080p")
         if media_info.get('resolution'):
-            info_parts.append(media_info['resolution'])
+            add(media_info['resolution'])
+        
+        # Uppercased once for both keyword scans below
+        filename_upper = filename_info.upper() if filename_info else ''
         
         # Source info from filename ONLY (can't be detected from file metadata)
-        if filename_info:
+        if filename_upper:
             # Extract source-related keywords from filename info
-            source_keywords = ['BLURAY', 'WEB-DL', 'WEBDL', 'WEBRIP', 'HDTV', 'PDTV', 'SDTV', 'BRRIP', 'BDRIP', 'DVD', 'DVDRIP']
-            for keyword in source_keywords:
-                if keyword in filename_info.upper():
-                    if keyword not in ' '.join(info_parts).upper():
-                        info_parts.append(keyword)
+            for keyword in PlexFileNamer._SOURCE_KEYWORDS:
+                if keyword in filename_upper:
+                    add(keyword)
                     break
         
         # ALWAYS use video codec from ffmpeg probe (ignores filename claims like "x264")
         if media_info.get('video_codec'):
-            info_parts.append(media_info['video_codec'])
+            add(media_info['video_codec'])
         
         # ALWAYS use audio codec from ffmpeg probe (ignores filename claims like "AAC")
         if media_info.get('audio_codec'):
-            info_parts.append(media_info['audio_codec'])
+            add(media_info['audio_codec'])
         
         # Add special tags from filename (can't be detected from file)
-        if filename_info:
-            special_keywords = ['PROPER', 'REPACK', 'EXTENDED', 'UNRATED', 'DIRECTOR\'S CUT', 'THEATRICAL']
-            for keyword in special_keywords:
-                if keyword in filename_info.upper():
-                    if keyword not in ' '.join(info_parts).upper():
-                        info_parts.append(keyword)
+        if filename_upper:
+            for keyword in PlexFileNamer._SPECIAL_KEYWORDS:
+                if keyword in filename_upper:
+                    add(keyword)
         
         return ' '.join(info_parts) if info_parts else None
     
     @staticmethod
+    @functools.lru_cache(maxsize=4096)
     def extract_optional_info(filename: str) -> Optional[str]:
         """
         Extract optional info from filename (quality, source, etc.)
         Looks for patterns like: 1080p, BluRay, WEB-DL, x264, etc.
+        Results are cached like parse_filename's
         """
         # Remove file extension
-        name = Path(filename).stem.lower()
-        
-        # Common quality and source indicators
-        optional_patterns = [
-            r'1080p', r'720p', r'480p', r'4k', r'2160p',
-            r'bluray', r'blu-ray', r'brrip', r'bdrip',
-            r'web-dl', r'webdl', r'webrip', r'web',
-            r'hdtv', r'pdtv', r'sdtv',
-            r'x264', r'x265', r'h264', r'h265', r'hevc',
-            r'aac', r'ac3', r'dts', r'mp3',
-            r'proper', r'repack', r'extended', r'unrated',
-            r'director\'?s?\s?cut', r'theatrical'
-        ]
+        name = PlexFileNamer._stem(filename).lower()
         
+        # One pass over the name, so tokens come back in filename order
         found_info = []
-        for pattern in optional_patterns:
-            matches = re.findall(rf'\b{pattern}\b', name, re.IGNORECASE)
-            for match in matches:
-                if match.lower() not in [info.lower() for info in found_info]:
-                    found_info.append(match.upper())
+        seen = set()  # matches already in found_info
+        for match in PlexFileNamer._OPTIONAL_INFO_RE.finditer(name):
+            token = match.group()
+            if token not in seen:
+                seen.add(token)
+                found_info.append(token.upper())
         
         return ' '.join(found_info) if found_info else None
 
@@ -636,24 +1163,20 @@ def check_resolution_mismatch(filename_optional_info: Optional[str], media_info:
         media_info: Media information from ffmpeg probe
     """
     if filename_optional_info and media_info.get('resolution'):
-        resolution_checks = [
-            ('1080P', '1080p'),
-            ('720P', '720p'),
-            ('4K', '4K'),
-            ('2160P', '4K'),
-            ('480P', '480p'),
-            ('1440P', '1440p')
-        ]
-        
-        for claimed, actual in resolution_checks:
-            if claimed in filename_optional_info.upper() and media_info['resolution'] != actual:
+        # filename_optional_info is space-separated tokens from extract_optional_info
+        claimed_tokens = set(filename_optional_info.upper().split())
+        
+        for claimed, actual in _CLAIMED_RESOLUTIONS.items():
+            if claimed in claimed_tokens and media_info['resolution'] != actual:
                 print(f"  Note: File is actually {media_info['resolution']}, not {actual} as filename suggests")
                 break
 
 
+@functools.lru_cache(maxsize=1)
 def load_config() -> Dict[str, Any]:
     """
     Load configuration from ~/.plex-renamer.conf if it exists
+    Read once per run - main() and TMDbAPI both ask for it, and the result is shared (don't modify it)
     
     Returns:
         Dict with configuration values, empty dict if no config file
@@ -662,6 +1185,8 @@ def load_config() -> Dict[str, Any]:
     config_values = {}
     
     if config_path.exists():
+        # Only needed when there's a config file, so don't pay for the import otherwise
+        import configparser
         try:
             config = configparser.ConfigParser()
             config.read(config_path)
@@ -681,6 +1206,8 @@ def load_config() -> Dict[str, Any]:
                     config_values['create_backups'] = defaults.getboolean('create_backups')
                 if 'skip_confirmation' in defaults:
                     config_values['skip_confirmation'] = defaults.getboolean('skip_confirmation')
+                if 'no_probe' in defaults:
+                    config_values['no_probe'] = defaults.getboolean('no_probe')
                     
             print(f"📝 Loaded config from: {config_path}")
         except Exception as e:
@@ -706,23 +1233,16 @@ def create_backup_file(old_path: Path, new_path: Path) -> None:
         # Variables to store the true original filename
         true_original_filename = None
         true_original_path = None
-        rename_history = []
+        # Only the last 10 renames are kept, so let the deque drop older ones as they're read
+        rename_history = collections.deque(maxlen=10)
         
         # If a backup already exists, read the true original filename from it
         if old_backup_path.exists():
             try:
-                with open(old_backup_path, 'r', encoding='utf-8') as f:
-                    lines = f.readlines()
-                    for line in lines:
-                        if line.startswith("Original filename:"):
-                            true_original_filename = line.split(":", 1)[1].strip()
-                        elif line.startswith("Original full path:"):
-                            true_original_path = line.split(":", 1)[1].strip()
-                        elif line.startswith("Rename history:"):
-                            # Parse existing rename history
-                            for history_line in lines[lines.index(line)+1:]:
-                                if history_line.strip() and not history_line.startswith("#"):
-                                    rename_history.append(history_line.strip())
+                backup = _load_backup(old_backup_path)
+                true_original_filename = backup['original_filename']
+                true_original_path = backup['original_path']
+                rename_history.extend(backup['history'])
                 print(f"📝 Found existing backup, preserving original: {true_original_filename}")
                 # Delete the old backup file as we'll create a new one
                 old_backup_path.unlink()
@@ -734,23 +1254,25 @@ def create_backup_file(old_path: Path, new_path: Path) -> None:
             true_original_filename = old_path.name
             true_original_path = str(old_path.absolute())
         
-        # Add current rename to history
-        rename_history.append(f"{__import__('datetime').datetime.now().isoformat()}: {old_path.name} → {new_path.name}")
+        # Add current rename to history - one timestamp for both this entry and "Last renamed on"
+        renamed_at = datetime.now().isoformat()
+        rename_history.append(f"{renamed_at}: {old_path.name} → {new_path.name}")
         
         # Create new backup filename based on new filename
         backup_filename = f"{new_path.stem}.original.txt"
         backup_path = new_path.parent / backup_filename
         
-        # Write backup info to file
+        # Write backup info as JSON (indented so it stays readable), in a single write
+        backup = {
+            'original_filename': true_original_filename,
+            'original_path': true_original_path,
+            'current_filename': new_path.name,
+            'last_renamed': renamed_at,
+            'history': list(rename_history),
+            'revert_hint': f"mv '{new_path.name}' '{true_original_filename}'",
+        }
         with open(backup_path, 'w', encoding='utf-8') as f:
-            f.write(f"Original filename: {true_original_filename}\n")
-            f.write(f"Original full path: {true_original_path}\n")
-            f.write(f"Current filename: {new_path.name}\n")
-            f.write(f"Last renamed on: {__import__('datetime').datetime.now().isoformat()}\n")
-            f.write(f"\nRename history:\n")
-            for entry in rename_history[-10:]:  # Keep last 10 renames
-                f.write(f"  {entry}\n")
-            f.write(f"\n# To revert: mv '{new_path.name}' '{true_original_filename}'\n")
+            f.write(json.dumps(backup, ensure_ascii=False, indent=2) + "\n")
         
         print(f"📝 Backup info saved: {backup_filename}")
         
@@ -758,6 +1280,100 @@ def create_backup_file(old_path: Path, new_path: Path) -> None:
         print(f"⚠️  Warning: Could not create backup file: {e}")
 
 
+def find_backup_files(folder: Path) -> List[Path]:
+    """
+    Recursively find .original.txt backup files under folder
+    Walks with os.scandir and only builds a Path for matches, instead of one per entry like rglob
+    
+    Args:
+        folder: Folder to search
+    
+    Returns:
+        Backup file paths, each folder's files before its subfolders' (like rglob)
+    """
+    backup_files = []
+    stack = [str(folder)]
+    while stack:
+        subdirs = []
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                    elif entry.name.endswith('.original.txt'):
+                        backup_files.append(Path(entry.path))
+        except OSError:
+            # Unreadable folder - rglob skips these too
+            continue
+        stack.extend(reversed(subdirs))
+    return backup_files
+
+
+def _load_backup(backup_file: Path) -> Dict[str, Any]:
+    """
+    Read a .original.txt backup file - JSON, or the line-based text format earlier versions wrote
+    
+    Args:
+        backup_file: Path to the backup file
+    
+    Returns:
+        Dict with original_filename, original_path and current_filename (each None if missing)
+        and history (list of entries, oldest first)
+    """
+    with open(backup_file, 'r', encoding='utf-8') as f:
+        text = f.read()
+    
+    if text.startswith('{'):
+        data = _json_loads(text)
+        return {
+            'original_filename': data.get('original_filename'),
+            'original_path': data.get('original_path'),
+            'current_filename': data.get('current_filename'),
+            'history': list(data.get('history') or ()),
+        }
+    
+    # Text format: "Field: value" header lines, then everything after "Rename history:" is history
+    backup = {'original_filename': None, 'original_path': None, 'current_filename': None, 'history': []}
+    in_history = False
+    for line in text.splitlines():
+        if in_history:
+            entry = line.strip()
+            # Skip blank lines and comments
+            if entry and not line.startswith("#"):
+                backup['history'].append(entry)
+            continue
+        # One split per line, then compare the field name
+        field, sep, value = line.partition(":")
+        if not sep:
+            continue
+        if field == "Original filename":
+            backup['original_filename'] = value.strip()
+        elif field == "Original full path":
+            backup['original_path'] = value.strip()
+        elif field == "Current filename":
+            backup['current_filename'] = value.strip()
+        elif field == "Renamed to" and not backup['current_filename']:
+            # Handle the oldest format, which had no "Current filename"
+            backup['current_filename'] = value.strip()
+        elif field == "Rename history":
+            in_history = True
+    return backup
+
+
+def read_backup_file(backup_file: Path) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Read the original and current filenames from a .original.txt backup file
+    
+    Args:
+        backup_file: Path to the backup file
+    
+    Returns:
+        (original_filename, renamed_filename) - either is None if missing from the file
+    """
+    backup = _load_backup(backup_file)
+    return backup['original_filename'], backup['current_filename']
+
+
 def revert_renames(folder_path: str, dry_run: bool = False) -> None:
     """
     Revert all renamed files in a folder by reading .original.txt backup files
@@ -768,12 +1384,13 @@ def revert_renames(folder_path: str, dry_run: bool = False) -> None:
     """
     folder = Path(folder_path)
     
-    if not folder.exists() or not folder.is_dir():
+    # is_dir() is False for a missing path too, so one stat covers both checks
+    if not folder.is_dir():
         print(f"Error: Folder does not exist: {folder_path}")
         return
     
     # Find all .original.txt backup files
-    backup_files = list(folder.rglob("*.original.txt"))
+    backup_files = find_backup_files(folder)
     
     if not backup_files:
         print(f"No backup files found in: {folder_path}")
@@ -782,29 +1399,25 @@ def revert_renames(folder_path: str, dry_run: bool = False) -> None:
     print(f"\nFound {len(backup_files)} backup file(s)")
     print("=" * 60)
     
+    # Read each backup file once - the preview and the revert both use these
+    def read_backup(backup_file: Path):
+        try:
+            return backup_file, read_backup_file(backup_file), None
+        except Exception as e:
+            return backup_file, (None, None), e
+    
+    # Reads are I/O-bound, so overlap them (the default pool size is sized for I/O);
+    # map() keeps the results in backup_files order
+    with ThreadPoolExecutor() as executor:
+        backups = list(executor.map(read_backup, backup_files))
+    
     # Show what will be reverted
     print("\nFiles that will be reverted:")
-    for backup_file in backup_files:
-        try:
-            with open(backup_file, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-            
-            original_filename = None
-            renamed_filename = None
-            
-            for line in lines:
-                if line.startswith("Original filename:"):
-                    original_filename = line.split(":", 1)[1].strip()
-                elif line.startswith("Current filename:"):
-                    renamed_filename = line.split(":", 1)[1].strip()
-                elif line.startswith("Renamed to:") and not renamed_filename:
-                    # Handle old format backup files
-                    renamed_filename = line.split(":", 1)[1].strip()
-            
-            if original_filename and renamed_filename:
-                print(f"  {renamed_filename} → {original_filename}")
-        except:
+    for backup_file, (original_filename, renamed_filename), error in backups:
+        if error:
             print(f"  {backup_file.name} (couldn't read)")
+        elif original_filename and renamed_filename:
+            print(f"  {renamed_filename} → {original_filename}")
     
     # Confirmation prompt (skip in dry-run mode)
     if not dry_run:
@@ -822,27 +1435,17 @@ def revert_renames(folder_path: str, dry_run: bool = False) -> None:
     failed = 0
     skipped = 0
     
-    for backup_file in backup_files:
+    for backup_file, (original_filename, renamed_filename), error in backups:
+        # .parent builds a new Path on every access, so look the folder up once per file
+        backup_folder = backup_file.parent
         print(f"\nProcessing: {backup_file.name}")
         print("-" * 40)
         
         try:
-            # Read the backup file
-            with open(backup_file, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-            
-            # Parse the original filename
-            original_filename = None
-            renamed_filename = None
-            
-            for line in lines:
-                if line.startswith("Original filename:"):
-                    original_filename = line.split(":", 1)[1].strip()
-                elif line.startswith("Current filename:"):
-                    renamed_filename = line.split(":", 1)[1].strip()
-                elif line.startswith("Renamed to:") and not renamed_filename:
-                    # Handle old format backup files
-                    renamed_filename = line.split(":", 1)[1].strip()
+            if error:
+                print(f"❌ Error processing {backup_file.name}: {error}")
+                failed += 1
+                continue
             
             if not original_filename or not renamed_filename:
                 print("❌ Invalid backup file format")
@@ -850,8 +1453,8 @@ def revert_renames(folder_path: str, dry_run: bool = False) -> None:
                 continue
             
             # Construct file paths
-            current_file = backup_file.parent / renamed_filename
-            original_file = backup_file.parent / original_filename
+            current_file = backup_folder / renamed_filename
+            original_file = backup_folder / original_filename
             
             if not current_file.exists():
                 print(f"❌ Renamed file not found: {renamed_filename}")
@@ -898,7 +1501,9 @@ def revert_renames(folder_path: str, dry_run: bool = False) -> None:
         print("Run without --dry-run to perform actual reversion")
 
 
-def process_video_file(file_path: str, api_key: Optional[str] = None, media_type: str = "auto", dry_run: bool = False, parentheses_only: bool = False) -> Optional[str]:
+def process_video_file(file_path: str, api_key: Optional[str] = None, media_type: str = "auto", dry_run: bool = False, parentheses_only: bool = False,
+                       media_info: Optional[Dict[str, Any]] = None, tmdb: Optional[TMDbAPI] = None,
+                       probe: bool = True) -> Optional[str]:
     """
     Main function to process a video file:
     1. Extract video duration
@@ -912,6 +1517,9 @@ def process_video_file(file_path: str, api_key: Optional[str] = None, media_type
         media_type: "movie", "tv", or "auto" (auto-detect)
         dry_run: If True, don't actually rename, just return the new path
         parentheses_only: If True, only look for years in parentheses format
+        media_info: Already-probed media info (e.g. from process_path's probe pool), probed here if None
+        tmdb: Shared TMDbAPI client (reuses its HTTP session), created from api_key if None
+        probe: If False, don't run ffprobe - optional info then only comes from the filename
     
     Returns:
         New filename following Plex conventions
@@ -919,7 +1527,8 @@ def process_video_file(file_path: str, api_key: Optional[str] = None, media_type
     
     # Initialize components
     inspector = VideoInspector()
-    tmdb = TMDbAPI(api_key)
+    if tmdb is None:
+        tmdb = TMDbAPI(api_key)
     namer = PlexFileNamer()
     
     # Get video file info
@@ -932,68 +1541,75 @@ def process_video_file(file_path: str, api_key: Optional[str] = None, media_type
     print("-" * 50)
     
     # Get detailed media info from ffmpeg probe
-    media_info = inspector.get_media_info(str(file_path))
+    if media_info is None:
+        media_info = inspector.get_media_info(str(file_path)) if probe else inspector.empty_media_info()
     duration_minutes = media_info['duration'] / 60
+    resolution = media_info['resolution']
+    video_codec = media_info['video_codec']
+    audio_codec = media_info['audio_codec']
     
     # Display media info
-    print(f"Video duration: {duration_minutes:.1f} minutes")
-    if media_info['resolution']:
-        print(f"Resolution: {media_info['resolution']}")
-        if media_info.get('raw_resolution'):
-            print(f"Raw resolution: {media_info['raw_resolution']}")
-    if media_info['video_codec']:
-        print(f"Video codec: {media_info['video_codec']}")
-    if media_info['audio_codec']:
-        print(f"Audio codec: {media_info['audio_codec']}")
-    
-    # Smart TV show analysis
+    if probe:
+        print(f"Video duration: {duration_minutes:.1f} minutes")
+    else:
+        print("Media info: not probed (--no-probe)")
+    if resolution:
+        print(f"Resolution: {resolution}")
+        raw_resolution = media_info.get('raw_resolution')
+        if raw_resolution:
+            print(f"Raw resolution: {raw_resolution}")
+    if video_codec:
+        print(f"Video codec: {video_codec}")
+    if audio_codec:
+        print(f"Audio codec: {audio_codec}")
+    
+    # Smart TV show analysis, with its fields bound once since each is used several times below
     tv_analysis = namer.analyze_tv_show(file_path, parentheses_only)
-    
-    print(f"Parsed title: {tv_analysis['show_name']}")
-    if tv_analysis['year']:
-        print(f"Parsed year: {tv_analysis['year']}")
-    if tv_analysis['season'] and tv_analysis['episode']:
-        print(f"Parsed episode: S{tv_analysis['season']:02d}E{tv_analysis['episode']:02d}")
-    elif tv_analysis['episode']:
-        print(f"Parsed episode: E{tv_analysis['episode']:02d}")
-    
-    print(f"TV show detected: {tv_analysis['is_tv_show']}")
+    title = tv_analysis.show_name
+    year = tv_analysis.year
+    season = tv_analysis.season
+    episode = tv_analysis.episode
+    is_tv_show = tv_analysis.is_tv_show
+    debug = tv_analysis.debug_info
+    
+    print(f"Parsed title: {title}")
+    if year:
+        print(f"Parsed year: {year}")
+    if season and episode:
+        print(f"Parsed episode: S{season:02d}E{episode:02d}")
+    elif episode:
+        print(f"Parsed episode: E{episode:02d}")
+    
+    print(f"TV show detected: {is_tv_show}")
     
     # Debug info
-    debug = tv_analysis['debug_info']
-    if debug['detected_episode']:
-        print(f"Note: Detected episode number {debug['detected_episode']} in filename")
-        if debug['in_movie_folder']:
-            print(f"Note: File is in movie folder '{debug['parent_folder']}', treating as movie not TV show")
+    if debug.detected_episode:
+        print(f"Note: Detected episode number {debug.detected_episode} in filename")
+        if debug.in_movie_folder:
+            print(f"Note: File is in movie folder '{debug.parent_folder}', treating as movie not TV show")
     
     # Warning for potential TV shows with missing episode numbers
-    if tv_analysis['missing_episode_warning']:
-        print(f"⚠️  WARNING: File is in season folder '{debug['parent_folder']}' but has no episode number!")
+    if tv_analysis.missing_episode_warning:
+        print(f"⚠️  WARNING: File is in season folder '{debug.parent_folder}' but has no episode number!")
         print(f"   This might be a TV show episode with missing episode info in filename.")
-        print(f"   Consider renaming to include episode number (e.g., S{debug['season_from_folder']:02d}E01, E01, etc.)")
+        print(f"   Consider renaming to include episode number (e.g., S{debug.season_from_folder:02d}E01, E01, etc.)")
     
     # Additional debug info
-    if debug['season_from_folder']:
-        print(f"Season from folder: {debug['season_from_folder']}")
-    if debug['show_name_from_path'] and debug['show_name_from_path'] != tv_analysis['show_name']:
-        print(f"Show name from path: {debug['show_name_from_path']}")
+    if debug.season_from_folder:
+        print(f"Season from folder: {debug.season_from_folder}")
+    if debug.show_name_from_path and debug.show_name_from_path != title:
+        print(f"Show name from path: {debug.show_name_from_path}")
     
     # Auto-detect media type if needed - TV analysis takes precedence
     if media_type == "auto":
-        media_type = "tv" if tv_analysis['is_tv_show'] else "movie"
+        media_type = "tv" if is_tv_show else "movie"
         print(f"Detected type: {media_type}")
-    elif media_type != "tv" and tv_analysis['is_tv_show']:
+    elif media_type != "tv" and is_tv_show:
         # User forced movie/other type but we detected TV show - warn and override
-        print(f"⚠️  WARNING: --type {media_type} specified but detected TV show with S{tv_analysis['season']:02d}E{tv_analysis['episode']:02d}")
+        print(f"⚠️  WARNING: --type {media_type} specified but detected TV show with S{season:02d}E{episode:02d}")
         print(f"   Overriding to --type tv for proper TV show processing")
         media_type = "tv"
     
-    # Extract individual values for compatibility
-    title = tv_analysis['show_name']
-    year = tv_analysis['year']
-    season = tv_analysis['season']
-    episode = tv_analysis['episode']
-    
     # Search for metadata
     print(f"\nSearching TMDb for: {title}")
     
@@ -1003,15 +1619,18 @@ def process_video_file(file_path: str, api_key: Optional[str] = None, media_type
         if show:
             print(f"Found TV show: {show['name']} ({show.get('first_air_date', 'N/A')[:4]})")
             
-            # Get detailed show info
-            details = tmdb.get_tv_details(show['id'])
+            # Get detailed show info, plus episode details for the episode title
+            # Both only need the show id, so they're fetched concurrently
+            details, episode_details = tmdb.get_tv_and_episode_details(
+                show['id'],
+                int(season) if season and episode else None,
+                int(episode) if season and episode else None
+            )
             if details:
                 show_year = int(details['first_air_date'][:4]) if details.get('first_air_date') else None
                 
-                # Get episode details for episode title
                 episode_title = None
                 if season and episode:
-                    episode_details = tmdb.get_episode_details(show['id'], int(season), int(episode))
                     if episode_details and episode_details.get('name'):
                         episode_title = episode_details['name']
                         print(f"Found episode title: {episode_title}")
@@ -1094,31 +1713,47 @@ def get_video_files(path: str) -> List[Path]:
     Returns:
         List of video file paths
     """
-    video_extensions = {
-        '.mp4', '.mkv', '.avi', '.mov', '.wmv', '.flv', '.webm',
-        '.m4v', '.mpg', '.mpeg', '.3gp', '.3g2', '.ts', '.mts',
-        '.m2ts', '.vob', '.ogv', '.divx', '.xvid', '.rm', '.rmvb'
-    }
-    
     path_obj = Path(path)
     video_files = []
     
-    if not path_obj.exists():
+    # One stat answers exists / is_file / is_dir
+    try:
+        mode = os.stat(path).st_mode
+    except OSError:
         print(f"Error: Path does not exist: {path}")
         return []
     
-    if path_obj.is_file():
+    if stat.S_ISREG(mode):
         # Single file
-        if path_obj.suffix.lower() in video_extensions:
+        if path_obj.suffix.lower() in _VIDEO_EXTENSIONS:
             video_files.append(path_obj)
-    elif path_obj.is_dir():
-        # Directory - walk recursively using os.walk (better for network shares)
+    elif stat.S_ISDIR(mode):
+        # Directory - walk recursively with os.scandir (better for network shares): each
+        # DirEntry already knows its type, so no extra stat calls and no Path per entry
         try:
-            for root, _, files in os.walk(path):
-                for file in files:
-                    file_path = Path(root) / file
-                    if file_path.suffix.lower() in video_extensions:
-                        video_files.append(file_path)
+            stack = [path]
+            while stack:
+                folder = stack.pop()
+                try:
+                    entries = os.scandir(folder)
+                except OSError:
+                    if folder is path:
+                        raise
+                    # Unreadable subfolder - skip it, like os.walk did
+                    continue
+                with entries:
+                    for entry in entries:
+                        if entry.is_dir():
+                            # Like os.walk, don't descend into symlinked folders
+                            if not entry.is_symlink():
+                                stack.append(entry.path)
+                            continue
+                        # Check the extension on the raw name, and only build a Path for videos
+                        # (rfind > 0 because, like Path.suffix, a dotfile such as ".mkv" has no extension -
+                        # every extension has a single dot, so the last dot is where the match starts)
+                        name = entry.name
+                        if name.lower().endswith(_VIDEO_EXTENSIONS_TUPLE) and name.rfind('.') > 0:
+                            video_files.append(Path(entry.path))
         except PermissionError as e:
             print(f"\n⚠️  Permission denied accessing directory: {path}")
             print(f"   Please grant Terminal/VS Code access in System Settings → Privacy & Security → Files and Folders")
@@ -1129,9 +1764,195 @@ def get_video_files(path: str) -> List[Path]:
     return sorted(video_files)
 
 
+class _FolderListings:
+    """
+    Casefolded file names per folder, listed once and kept up to date by rename_file, so the
+    "does the target exist?" checks before the confirmation prompt need no stat per file
+    Names are casefolded so a miss is a real miss on case-insensitive filesystems too (e.g. macOS);
+    a hit is confirmed with a real exists() call
+    
+    Only folders holding more than one of the given files are listed - new names stay in the same
+    folder, and for a lone file a single stat is cheaper than listing the whole folder
+    """
+    
+    def __init__(self, video_files: List[Path]):
+        self._names: Dict[str, set] = {}
+        folder_counts = collections.Counter(str(video_file.parent) for video_file in video_files)
+        self._listed_folders = {folder for folder, count in folder_counts.items() if count > 1}
+    
+    def _listing(self, folder: str) -> Optional[set]:
+        names = self._names.get(folder)
+        if names is None:
+            if folder not in self._listed_folders:
+                return None
+            try:
+                names = self._names[folder] = {name.casefold() for name in os.listdir(folder)}
+            except OSError:
+                return None
+        return names
+    
+    def exists(self, path: Path) -> bool:
+        """Same answer as path.exists(), skipping the stat when the folder listing rules the name out"""
+        names = self._listing(str(path.parent))
+        if names is not None and path.name.casefold() not in names:
+            return False
+        return path.exists()
+    
+    def renamed(self, old_path: Path, new_path: Path) -> None:
+        """Record a rename made since the folders were listed"""
+        names = self._names.get(str(old_path.parent))
+        if names is not None:
+            names.discard(old_path.name.casefold())
+        names = self._listing(str(new_path.parent))
+        if names is not None:
+            names.add(new_path.name.casefold())
+
+
+def check_rename(video_file: Path, new_path: Optional[Path], dry_run: bool = False, rename: bool = False,
+                 listings: Optional[_FolderListings] = None) -> Optional[str]:
+    """
+    Decide what to do with process_video_file's suggested name for one file
+    
+    Args:
+        video_file: Current path of the video file
+        new_path: Suggested new path, or None if one couldn't be determined
+        dry_run: Preview mode without renaming
+        rename: Actually rename files (ignored if dry_run is True)
+        listings: Folder listings to check the target against instead of a stat per file
+    
+    Returns:
+        'successful', 'failed' or 'skipped' for process_path's summary, or None if the file should be renamed
+    """
+    if not new_path:
+        print("❌ Could not determine new filename")
+        return 'failed'
+    
+    if dry_run or not rename:
+        return 'successful'
+    
+    if video_file == new_path:
+        print("File already has correct name")
+        return 'skipped'
+    
+    if listings.exists(new_path) if listings else new_path.exists():
+        print(f"⚠️  Target file already exists, skipping")
+        return 'skipped'
+    
+    return None
+
+
+def rename_file(old_path: Path, new_path: Path, listings: Optional[_FolderListings] = None) -> str:
+    """
+    Back up the original name and rename one file
+    
+    Args:
+        old_path: Current path of the video file
+        new_path: New path
+        listings: Folder listings to record the rename in, so later check_rename calls see it
+    
+    Returns:
+        'successful' or 'skipped', for process_path's summary
+    """
+    # Checked again here, with a real stat: the listings may be out of date by now (the confirmation
+    # prompt can wait any length of time), and rename() would silently replace an existing file
+    if new_path.exists():
+        print(f"⚠️  Target file already exists, skipping")
+        return 'skipped'
+    
+    # Create backup file before renaming
+    create_backup_file(old_path, new_path)
+    # Perform the rename
+    old_path.rename(new_path)
+    if listings:
+        listings.renamed(old_path, new_path)
+    print(f"✓ File renamed successfully")
+    return 'successful'
+
+
+def confirm_renames(renames: List[Tuple[Path, Path]]) -> List[Tuple[Path, Path]]:
+    """
+    Show every pending rename as one numbered list and ask once which to apply
+    
+    Args:
+        renames: (old_path, new_path) pairs
+    
+    Returns:
+        The confirmed pairs, in their original order - none if stdin closes or the user hits Ctrl+C
+    """
+    print("\n" + "=" * 60)
+    print(f"PENDING RENAMES ({len(renames)})")
+    print("=" * 60)
+    lines = []
+    for i, (old_path, new_path) in enumerate(renames, 1):
+        lines.append(f"\n{i}. From: {old_path.name}\n   To:   {new_path.name}\n")
+    print("".join(lines), end="")
+    
+    try:
+        response = input("\nApply these renames? (y/N/select): ").strip().lower()
+        if response in ['y', 'yes']:
+            return renames
+        if response not in ['s', 'select']:
+            return []
+        selection = input("Files to rename (e.g. 1,3,5): ")
+    except (EOFError, KeyboardInterrupt):
+        # No answer (e.g. a piped or non-interactive run) - same as answering N
+        print()
+        return []
+    
+    selected = set()
+    for part in selection.split(','):
+        part = part.strip()
+        if not part:
+            continue
+        # isdecimal(), not isdigit(): int() rejects digits like "²" that isdigit() accepts
+        if part.isdecimal() and 1 <= int(part) <= len(renames):
+            selected.add(int(part))
+        else:
+            print(f"⚠️  Ignoring invalid selection: {part}")
+    return [pair for i, pair in enumerate(renames, 1) if i in selected]
+
+
+class _CapturedOutput:
+    """
+    sys.stdout stand-in that lets worker threads print into their own buffer
+    process_path uses it to run per-file lookups concurrently and still print each file's output in order
+    Anything not inside capture() writes straight through to the wrapped stream
+    """
+    
+    _buffer: contextvars.ContextVar = contextvars.ContextVar('_captured_output_buffer', default=None)
+    
+    def __init__(self, stream):
+        self.stream = stream
+    
+    def write(self, text: str) -> int:
+        buffer = self._buffer.get()
+        return (buffer if buffer is not None else self.stream).write(text)
+    
+    def flush(self) -> None:
+        if self._buffer.get() is None:
+            self.stream.flush()
+    
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.stream, name)
+    
+    @contextlib.contextmanager
+    def capture(self):
+        """Collect everything printed in the current context into a StringIO"""
+        buffer = io.StringIO()
+        token = self._buffer.set(buffer)
+        try:
+            yield buffer
+        finally:
+            self._buffer.reset(token)
+
+
+# Files looked up at once by process_path - TMDbAPI.RATE_LIMITER still caps the request rate
+MAX_LOOKUP_WORKERS = 8
+
+
 def process_path(path: str, api_key: Optional[str] = None, media_type: str = "auto", 
                  dry_run: bool = False, rename: bool = False, parentheses_only: bool = False,
-                 skip_confirmation: bool = False) -> None:
+                 skip_confirmation: bool = False, probe: bool = True) -> None:
     """
     Process a file or directory of video files
     
@@ -1141,7 +1962,8 @@ def process_path(path: str, api_key: Optional[str] = None, media_type: str = "au
         media_type: "movie", "tv", or "auto"
         dry_run: Preview mode without renaming
         rename: Actually rename files (ignored if dry_run is True)
-        skip_confirmation: Skip confirmation prompt for each rename
+        skip_confirmation: Skip the confirmation prompt for the batch of renames
+        probe: Run ffprobe for resolution/codec info (False skips it - much faster, filename info only)
     """
     video_files = get_video_files(path)
     
@@ -1152,60 +1974,117 @@ def process_path(path: str, api_key: Optional[str] = None, media_type: str = "au
     print(f"\nFound {len(video_files)} video file(s)")
     print("=" * 60)
     
-    successful = 0
-    failed = 0
-    skipped = 0
+    # One client for the whole batch so its HTTP connections are reused between files
+    tmdb = TMDbAPI(api_key)
     
-    for i, video_file in enumerate(video_files, 1):
-        print(f"\n[{i}/{len(video_files)}] Processing: {video_file}")
-        print("-" * 60)
-        
+    # 'successful' / 'failed' / 'skipped' -> number of files
+    counts = collections.Counter()
+    # (old_path, new_path) renames waiting for the one confirmation prompt after all lookups
+    pending = []
+    # Target folders are listed once rather than stat-ing every suggested name
+    listings = _FolderListings(video_files)
+    
+    # Probe cache writes for the whole scan go into one transaction
+    probe_cache = get_probe_cache()
+    with probe_cache.batch() if probe_cache else contextlib.nullcontext():
+        # Look files up concurrently (TMDb round-trips dominate), each worker printing into its own
+        # buffer. Renames and confirmations below stay sequential, in file order
+        output = _CapturedOutput(sys.stdout)
+        
+        # Every file is probed right away in its own pool, in file order. Each lookup below only
+        # waits for its own file's probe, so TMDb lookups overlap with the probes still running
+        probe_pool = ThreadPoolExecutor(max_workers=MAX_PROBE_WORKERS)
+        probes = {}
+        
+        def run_probe(file_path: str) -> Tuple[str, bool]:
+            """Probe one file, returning anything it printed (e.g. cache warnings) and whether it worked"""
+            with output.capture() as captured:
+                try:
+                    VideoInspector.probe(file_path)
+                    ok = True
+                except Exception:
+                    ok = False
+            return captured.getvalue(), ok
+        
+        def media_info_for(file_path: str) -> Optional[Dict[str, Any]]:
+            """
+            Media info once this file's probe is done, or None if it failed - process_video_file then
+            probes again itself, so the error is reported alongside that file's output
+            """
+            if file_path not in probes:
+                return None
+            # Called from look_up, so the probe's output lands in this file's buffer
+            probe_output, ok = probes[file_path].result()
+            print(probe_output, end="")
+            if not ok:
+                return None
+            # The probe is cached now, so this is just parsing
+            return VideoInspector.get_media_info(file_path)
+        
+        def look_up(video_file: Path) -> Tuple[Optional[str], str, Optional[Exception]]:
+            with output.capture() as captured:
+                try:
+                    file_path = str(video_file)
+                    new_path = process_video_file(file_path, api_key, media_type, dry_run, parentheses_only,
+                                                  media_info=media_info_for(file_path), tmdb=tmdb, probe=probe)
+                    return new_path, captured.getvalue(), None
+                except Exception as e:
+                    return None, captured.getvalue(), e
+        
+        sys.stdout = output
         try:
-            new_path = process_video_file(str(video_file), api_key, media_type, dry_run, parentheses_only)
+            if probe:
+                for video_file in video_files:
+                    probes[str(video_file)] = probe_pool.submit(run_probe, str(video_file))
             
-            if new_path:
-                old_path = Path(video_file)
-                new_path = Path(new_path)
-                
-                if not dry_run and rename:
-                    if old_path != new_path:
-                        if new_path.exists():
-                            print(f"⚠️  Target file already exists, skipping")
-                            skipped += 1
-                        else:
-                            # Ask for confirmation unless skip_confirmation is True
-                            should_rename = skip_confirmation
+            # map() yields in file order as results come in, so early files can be renamed while
+            # later ones are still being looked up. closing() cancels queued lookups if we stop early
+            with ThreadPoolExecutor(max_workers=MAX_LOOKUP_WORKERS) as executor, \
+                    contextlib.closing(executor.map(look_up, video_files)) as lookups:
+                for i, (video_file, (new_path, lookup_output, lookup_error)) in enumerate(zip(video_files, lookups), 1):
+                    # The header and the worker's buffered output go out in a single write
+                    print(f"\n[{i}/{len(video_files)}] Processing: {video_file}\n{'-' * 60}\n{lookup_output}", end="")
+                    
+                    try:
+                        if lookup_error:
+                            raise lookup_error
+                        # One Path per suggestion, shared by the checks and the rename
+                        new_path = Path(new_path) if new_path else None
+                        outcome = check_rename(video_file, new_path, dry_run, rename, listings)
+                        if outcome is None:
                             if not skip_confirmation:
-                                print(f"\nRename this file?")
-                                print(f"  From: {old_path.name}")
-                                print(f"  To:   {new_path.name}")
-                                response = input("Confirm rename? (y/N): ").strip().lower()
-                                should_rename = response in ['y', 'yes']
-                            
-                            if should_rename:
-                                # Create backup file before renaming
-                                create_backup_file(old_path, new_path)
-                                # Perform the rename
-                                old_path.rename(new_path)
-                                print(f"✓ File renamed successfully")
-                                successful += 1
-                            else:
-                                print("⚠️  Rename skipped by user")
-                                skipped += 1
-                    else:
-                        print("File already has correct name")
-                        skipped += 1
-                elif dry_run:
-                    successful += 1
-                else:
-                    successful += 1
-            else:
-                print("❌ Could not determine new filename")
-                failed += 1
-                
-        except Exception as e:
-            print(f"❌ Error processing file: {e}")
-            failed += 1
+                                pending.append((video_file, new_path))
+                                continue
+                            outcome = rename_file(video_file, new_path, listings)
+                        counts[outcome] += 1
+                    except Exception as e:
+                        print(f"❌ Error processing file: {e}")
+                        counts['failed'] += 1
+        finally:
+            sys.stdout = output.stream
+            # Don't keep probing files nobody will look at if we stopped early
+            # (cancelled by hand - shutdown(cancel_futures=True) needs Python 3.9)
+            for future in probes.values():
+                future.cancel()
+            probe_pool.shutdown()
+    
+    # Ask once for the whole batch instead of stopping the loop at every file
+    if pending:
+        confirmed = set(confirm_renames(pending))
+        for old_path, new_path in pending:
+            if (old_path, new_path) not in confirmed:
+                counts['skipped'] += 1
+                continue
+            print(f"\nRenaming: {old_path.name}")
+            try:
+                counts[rename_file(old_path, new_path, listings)] += 1
+            except Exception as e:
+                print(f"❌ Error processing file: {e}")
+                counts['failed'] += 1
+        if len(confirmed) < len(pending):
+            print(f"\n⚠️  {len(pending) - len(confirmed)} rename(s) skipped by user")
+    
+    successful, failed, skipped = counts['successful'], counts['failed'], counts['skipped']
     
     # Summary
     print("\n" + "=" * 60)
@@ -1243,10 +2122,13 @@ def main():
                        help="Preview mode - show what would be renamed without actually renaming")
     parser.add_argument("--yes", "-y", action="store_true", dest="skip_confirmation",
                        default=config.get('skip_confirmation', False),
-                       help="Skip confirmation prompt for each rename (auto-approve all renames)")
+                       help="Skip the confirmation prompt (auto-approve all renames)")
     parser.add_argument("--parentheses-only", action="store_true",
                        default=config.get('parentheses_only', False),
                        help="Only look for years in parentheses format (2004), not - 2004 or space 2004")
+    parser.add_argument("--no-probe", action="store_false", dest="probe",
+                       default=not config.get('no_probe', False),
+                       help="Don't inspect files with ffprobe - much faster, but resolution and codecs are left out of the name")
     parser.add_argument("--revert", action="store_true",
                        help="Revert all renames in the specified folder using backup files")
     
@@ -1258,7 +2140,7 @@ def main():
     else:
         # Process the path (file or directory)
         process_path(args.path, args.api_key, args.type, args.dry_run, args.rename, args.parentheses_only,
-                    args.skip_confirmation)
+                    args.skip_confirmation, args.probe)
 
 
 if __name__ == "__main__":